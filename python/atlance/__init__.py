@@ -0,0 +1,15 @@
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve `atlance.root_agent` on first access (PEP 562).
+
+    Importing a helper such as `atlance.images` then does not build every agent; the ADK loader
+    still finds `root_agent` on the package.
+    """
+    if name == "root_agent":
+        from .agent import root_agent
+
+        return root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,22 +12,89 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from google.adk.agents import Agent
-from .sub_agents.data_extractor_agent.agent import data_extractor_agent as a2
-from .sub_agents.duplicate_remover_agent.agent import duplicate_remover_agent as a1
-from .sub_agents.question_asker.agent import question_asker as a3
-from google.adk.tools import agent_tool
-
-
-am = Agent(
-    model="gemini-2.5-flash",
-    name="root_agent",
-    description="You receive pictures. You may use tool agents to select a subsect, extract intesting info and then ask the user questions about the images. All this with the end goals of making a travel blog.",
-    tools=[
-        agent_tool.AgentTool(agent=a1),
-        agent_tool.AgentTool(agent=a2),
-        agent_tool.AgentTool(agent=a3),
-    ],
-)
-
-root_agent = am
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from google.adk.agents import BaseAgent
+
+# Set ATLANCE_DYNAMIC_ROUTING=1 to let the root model decide which agents to call instead.
+DYNAMIC_ROUTING = os.getenv("ATLANCE_DYNAMIC_ROUTING") == "1"
+
+
+def build_agent(dynamic_routing: bool = DYNAMIC_ROUTING) -> "BaseAgent":
+    """
+    Build the root agent and all of its sub-agents.
+
+    The sub-agent modules are imported here, not at module level, so they are only loaded and
+    constructed in processes that actually run the agents. Each call works on fresh clones of the
+    module-level sub-agents (an agent can only have one parent), so it can be called again, e.g.
+    to build the other routing mode in a script or test.
+
+    Args:
+        dynamic_routing (bool): Whether a root model picks the agents to call instead of the fixed pipeline.
+
+    Returns:
+        BaseAgent: The fixed `blog_pipeline`, or the tool-routing `root_agent` model.
+    """
+    from google.adk.agents import Agent, ParallelAgent, SequentialAgent
+    from google.adk.tools import agent_tool
+
+    from .models import gemini
+    from .response_cache import cached_response, store_response
+    from .sub_agents.album_joiner.agent import album_joiner
+    from .sub_agents.data_extractor_agent.agent import data_extractor_agent
+    from .sub_agents.duplicate_remover_agent import duplicate_remover_agent
+    from .sub_agents.question_asker.agent import question_asker
+    from .sub_agents.story_agent.agent import story_agent
+
+    a1, a2, a3 = duplicate_remover_agent.clone(), data_extractor_agent.clone(), question_asker.clone()
+    album_joiner, story_agent = album_joiner.clone(), story_agent.clone()
+
+    # Duplicate removal and data extraction only depend on the raw images, so they
+    # run concurrently; the joiner then keeps the extracted data of the selected
+    # images without an extra model call.
+    extract_and_dedupe = ParallelAgent(
+        name="extract_and_dedupe",
+        description="Selects the most interesting distinct images and extracts their data at the same time.",
+        sub_agents=[a1, a2],
+    )
+
+    image_pipeline = SequentialAgent(
+        name="image_pipeline",
+        description="Selects a subset of the pictures and returns the extracted info of the selected pictures.",
+        sub_agents=[extract_and_dedupe, album_joiner],
+    )
+
+    if dynamic_routing:
+        return Agent(
+            model=gemini("gemini-2.5-flash"),
+            name="root_agent",
+            description="You receive pictures. You may use tool agents to select a subsect and extract intesting info in one go and then ask the user questions about the images. All this with the end goals of making a travel blog.",
+            tools=[
+                agent_tool.AgentTool(agent=image_pipeline),
+                agent_tool.AgentTool(agent=story_agent),
+                agent_tool.AgentTool(agent=a3),
+            ],
+            before_model_callback=cached_response,
+            after_model_callback=store_response,
+        )
+
+    # The preliminary story is prose nobody waits on, so it is written while the
+    # question for the user is generated.
+    story_and_question = ParallelAgent(
+        name="story_and_question",
+        description="Writes the preliminary story and asks the user a question about the pictures at the same time.",
+        sub_agents=[story_agent, a3],
+    )
+
+    # The images always go through the same steps, so a fixed pipeline replaces the
+    # tool-selecting root model and its extra planning turn.
+    return SequentialAgent(
+        name="blog_pipeline",
+        description="Selects and analyses the pictures, then asks the user questions about them for the travel blog.",
+        sub_agents=[image_pipeline, story_and_question],
+    )
+
+
+root_agent = build_agent()
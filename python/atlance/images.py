@@ -0,0 +1,161 @@
+import hashlib
+import io
+import json
+from collections import OrderedDict
+from datetime import datetime
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from PIL import ExifTags, Image
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+# Gemini downsamples large images itself; sending at most this many pixels per side saves the
+# upload and the image tokens without changing what the model can see.
+MAX_SIDE = 1024
+JPEG_QUALITY = 85
+
+# Downscaled copies by digest of the original bytes, so the cache holds only thumbnails (None for
+# images that are sent unchanged), never the full-size photos.
+_DOWNSCALE_CACHE_SIZE = 64
+_downscaled: OrderedDict[Tuple[str, str], Optional[Tuple[bytes, str]]] = OrderedDict()
+
+
+def _gps_degrees(dms: Sequence[float], ref: str) -> float:
+    """Convert EXIF degrees/minutes/seconds and an N/S/E/W reference to signed decimal degrees."""
+    degrees = float(dms[0]) + float(dms[1]) / 60 + float(dms[2]) / 3600
+    return -degrees if ref in ("S", "W") else degrees
+
+
+def read_exif(data: bytes) -> Dict[str, Any]:
+    """
+    Read the capture time and GPS position of an image from its EXIF data.
+
+    Args:
+        data (bytes): The encoded image.
+
+    Returns:
+        Dict[str, Any]: `{"timestamp": str | None, "location": {"lat": float, "lng": float} | None}`,
+            shaped like the matching `ImageAnalysis` fields. The timestamp is ISO 8601 and carries the
+            UTC offset when the camera recorded one.
+    """
+    try:
+        exif = Image.open(io.BytesIO(data)).getexif()
+    except (OSError, Image.DecompressionBombError):
+        # Undecodable formats (e.g. HEIC) and images above Pillow's pixel limit have no local metadata.
+        return {"timestamp": None, "location": None}
+    details = exif.get_ifd(ExifTags.IFD.Exif)
+    gps = exif.get_ifd(ExifTags.IFD.GPSInfo)
+
+    timestamp = None
+    taken = details.get(ExifTags.Base.DateTimeOriginal) or exif.get(ExifTags.Base.DateTime)
+    if taken:
+        try:
+            timestamp = datetime.strptime(str(taken).strip(), "%Y:%m:%d %H:%M:%S").isoformat()
+            timestamp += str(details.get(ExifTags.Base.OffsetTimeOriginal) or "").strip()
+        except ValueError:
+            timestamp = None
+
+    location = None
+    try:
+        location = {
+            "lat": _gps_degrees(gps[ExifTags.GPS.GPSLatitude], gps[ExifTags.GPS.GPSLatitudeRef]),
+            "lng": _gps_degrees(gps[ExifTags.GPS.GPSLongitude], gps[ExifTags.GPS.GPSLongitudeRef]),
+        }
+    except (KeyError, IndexError, TypeError, ZeroDivisionError):
+        location = None
+    return {"timestamp": timestamp, "location": location}
+
+
+def annotate_request_exif(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """
+    Before-model callback that adds the EXIF metadata of every inline image as text after it.
+
+    The model only sees pixels, so it cannot read timestamps or coordinates itself. Images are
+    numbered from 0 in request order, matching the indices of the duplicate remover.
+
+    Args:
+        callback_context (CallbackContext): The callback context (unused).
+        llm_request (LlmRequest): The request about to be sent to the model.
+
+    Returns:
+        Optional[LlmResponse]: Always None, so the model is still called.
+    """
+    index = 0
+    for content in llm_request.contents:
+        parts = []
+        for part in content.parts or []:
+            parts.append(part)
+            blob = part.inline_data
+            if blob and blob.data and (blob.mime_type or "").startswith("image/"):
+                metadata = {**({"path": blob.display_name} if blob.display_name else {}), **read_exif(blob.data)}
+                parts.append(types.Part(text=f"EXIF of image {index}: {json.dumps(metadata)}"))
+                index += 1
+        content.parts = parts
+    return None
+
+
+def _downscale(data: bytes) -> Optional[Tuple[bytes, str]]:
+    """Re-encode an image at most `MAX_SIDE` pixels wide and high, or None to send it unchanged."""
+    try:
+        image = Image.open(io.BytesIO(data))
+        if max(image.size) <= MAX_SIDE:
+            return None
+        exif = image.info.get("exif")
+        image = image.convert("RGB")
+        image.thumbnail((MAX_SIDE, MAX_SIDE), Image.LANCZOS)
+    except (OSError, Image.DecompressionBombError):
+        # Formats Pillow cannot decode (e.g. HEIC without a plugin) are left for the model to read.
+        return None
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=JPEG_QUALITY, **({"exif": exif} if exif else {}))
+    return buffer.getvalue(), "image/jpeg"
+
+
+def downscale_image(data: bytes, mime_type: str) -> Tuple[bytes, str]:
+    """
+    Shrink an encoded image so its longest side is at most `MAX_SIDE` pixels.
+
+    The result is re-encoded as JPEG with the original EXIF block, so the capture time and GPS
+    position stay with the image. Cached because the same images are re-sent on every model
+    call of a turn. Images Pillow cannot decode are sent unchanged.
+
+    Args:
+        data (bytes): The encoded image.
+        mime_type (str): The MIME type of `data`.
+
+    Returns:
+        Tuple[bytes, str]: The new image bytes and MIME type, or the input unchanged when the image
+            is already small enough or cannot be decoded.
+    """
+    key = (hashlib.blake2b(data).hexdigest(), mime_type)
+    if key in _downscaled:
+        _downscaled.move_to_end(key)
+    else:
+        _downscaled[key] = _downscale(data)
+        while len(_downscaled) > _DOWNSCALE_CACHE_SIZE:
+            _downscaled.popitem(last=False)
+    return _downscaled[key] or (data, mime_type)
+
+
+def downscale_request_images(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """
+    Before-model callback that replaces every inline image of the request by a downscaled copy.
+
+    The request contents are rebuilt from the session for each model call, so rewriting them here
+    (rather than the user content) is what reaches the model; the stored session keeps the originals.
+
+    Args:
+        callback_context (CallbackContext): The callback context (unused).
+        llm_request (LlmRequest): The request about to be sent to the model.
+
+    Returns:
+        Optional[LlmResponse]: Always None, so the model is still called.
+    """
+    for content in llm_request.contents:
+        for part in content.parts or []:
+            blob = part.inline_data
+            if blob and blob.data and (blob.mime_type or "").startswith("image/"):
+                data, mime_type = downscale_image(blob.data, blob.mime_type)
+                part.inline_data = types.Blob(data=data, mime_type=mime_type, display_name=blob.display_name)
+    return None
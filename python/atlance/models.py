@@ -0,0 +1,80 @@
+import asyncio
+import weakref
+from typing import Optional
+
+import httpx
+from google.adk.models.google_llm import Gemini
+from google.genai import Client, types
+
+# Keep-alive connections kept open per client. The parallel steps and the speculative copies of the
+# duplicate remover send several requests at once, so this is well above the number of agents.
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+# httpx connections belong to the event loop that opened them, so there is one client per loop (the
+# server runs a single loop; every `asyncio.run` of the album helper gets its own).
+_loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Client]" = weakref.WeakKeyDictionary()
+_client: Optional[Client] = None
+
+
+def _new_client() -> Client:
+    """Create a client whose async transport speaks HTTP/2 and keeps its connections alive."""
+    return Client(
+        http_options=types.HttpOptions(
+            # Same retries as ADK's default client; ADK adds its tracking headers to every request.
+            retry_options=types.HttpRetryOptions(initial_delay=1, attempts=2),
+            async_client_args={
+                "http2": True,
+                "limits": httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+            },
+        )
+    )
+
+
+def shared_client() -> Client:
+    """
+    Return the genai client shared by all agents.
+
+    Vertex AI or the Gemini API is chosen from the environment (`GOOGLE_GENAI_USE_VERTEXAI`), as
+    for ADK's own client.
+
+    Returns:
+        Client: The client of the running event loop, or a process-wide client outside a loop.
+    """
+    global _client
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        if _client is None:
+            _client = _new_client()
+        return _client
+    if loop not in _loop_clients:
+        _loop_clients[loop] = _new_client()
+    return _loop_clients[loop]
+
+
+class SharedClientGemini(Gemini):
+    """
+    Gemini model that sends its requests through `shared_client()`.
+
+    With a model name, ADK builds a new `Gemini` and thus a new client and connection pool for
+    every model call, paying the TCP and TLS handshake each time. Agents given an instance of this
+    class reuse warm connections instead.
+    """
+
+    @property
+    def api_client(self) -> Client:
+        """The shared client; overrides ADK's per-instance client."""
+        return shared_client()
+
+
+def gemini(model: str) -> SharedClientGemini:
+    """
+    Build the model of an agent, e.g. `Agent(model=gemini("gemini-2.5-flash"), ...)`.
+
+    Args:
+        model (str): The Gemini model name.
+
+    Returns:
+        SharedClientGemini: The model, backed by the shared client.
+    """
+    return SharedClientGemini(model=model)
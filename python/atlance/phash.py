@@ -0,0 +1,94 @@
+import io
+
+import numpy as np
+from numba import njit  # Compiles the DCT loops to machine code; cached on disk after the first call.
+from PIL import Image
+
+# The image is reduced to SIZE x SIZE pixels; the hash keeps the BLOCK x BLOCK lowest frequencies.
+SIZE = 32
+BLOCK = 8
+
+# Unnormalised DCT-II basis of the kept frequencies: _COSINES[k, n] = cos(pi * (2n + 1) * k / (2 * SIZE)).
+# Scaling does not change which coefficients lie above the median, so the bits match `imagehash.phash`.
+_COSINES = np.cos(np.pi * np.outer(np.arange(BLOCK), 2 * np.arange(SIZE) + 1) / (2 * SIZE)).astype(np.float32)
+
+
+@njit(cache=True, fastmath=True)
+def _phash64(gray: np.ndarray, cosines: np.ndarray) -> np.uint64:
+    """Hash a SIZE x SIZE float32 grayscale image with the given DCT basis; see `phash64`."""
+    block, size = cosines.shape
+    # Transform the rows, then the columns, computing only the low-frequency block.
+    rows = np.zeros((size, block), dtype=np.float32)
+    for y in range(size):
+        for k in range(block):
+            total = np.float32(0.0)
+            for x in range(size):
+                total += gray[y, x] * cosines[k, x]
+            rows[y, k] = total
+    low = np.zeros((block, block), dtype=np.float32)
+    for j in range(block):
+        for k in range(block):
+            total = np.float32(0.0)
+            for y in range(size):
+                total += rows[y, k] * cosines[j, y]
+            low[j, k] = total
+
+    median = np.median(low)
+    bits = np.uint64(0)
+    for j in range(block):
+        for k in range(block):
+            bits = (bits << np.uint64(1)) | np.uint64(low[j, k] > median)
+    return bits
+
+
+def phash64(gray: np.ndarray) -> int:
+    """
+    Compute the 64-bit perceptual hash of a grayscale image.
+
+    Args:
+        gray (np.ndarray): A `SIZE` x `SIZE` float32 array of pixel intensities.
+
+    Returns:
+        int: The hash; bit 63 is the DC coefficient, bits follow the 8x8 block in row-major order.
+    """
+    return int(_phash64(gray, _COSINES))
+
+
+def image_phash(data: bytes) -> int:
+    """
+    Compute the perceptual hash of an encoded image, e.g. a JPEG or PNG file.
+
+    Args:
+        data (bytes): The encoded image.
+
+    Returns:
+        int: The 64-bit hash of `phash64`; re-encoded or resized copies of a photo hash (almost) the same.
+
+    Raises:
+        OSError: If Pillow cannot decode the image (`PIL.UnidentifiedImageError` for unsupported
+            formats such as HEIC without a plugin, or a truncated file).
+        PIL.Image.DecompressionBombError: If the image exceeds Pillow's pixel limit.
+    """
+    image = Image.open(io.BytesIO(data))
+    # Decoding dominates on full-size photos; JPEGs are decoded at a reduced scale that still leaves
+    # plenty of pixels for the 32x32 resize.
+    image.draft("L", (4 * SIZE, 4 * SIZE))
+    image = image.convert("L").resize((SIZE, SIZE), Image.Resampling.LANCZOS)
+    return phash64(np.asarray(image, dtype=np.float32))
+
+
+def hamming(a: int, b: int) -> int:
+    """
+    Count the bits in which two hashes differ; near-duplicate photos are a few bits apart.
+
+    A utility for comparing hashes, e.g. in tests or when tuning a near-duplicate threshold; the
+    selection cache only uses exact hashes.
+
+    Args:
+        a (int): A hash from `image_phash`.
+        b (int): Another hash.
+
+    Returns:
+        int: The Hamming distance, from 0 to 64.
+    """
+    return (a ^ b).bit_count()
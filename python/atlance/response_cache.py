@@ -0,0 +1,112 @@
+import functools
+import hashlib
+import json
+import os
+from typing import Any, Optional
+
+import diskcache  # Persistent key-value store shared by all agents and worker processes.
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from pydantic import BaseModel
+
+# Identical re-runs during development (same prompt, same images) are answered from disk.
+# Set ADK_NOCACHE=1 to always call the model.
+CACHE_DIR = ".adk_cache"
+TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Per-agent session state key that carries the request key to the response callback. Agents run
+# concurrently in the parallel step, so each needs its own; `temp:` keeps it out of the session.
+_KEY_STATE = "temp:response_cache_key:{agent}"
+
+
+@functools.lru_cache(maxsize=None)
+def _open_cache(directory: str) -> diskcache.FanoutCache:
+    """Open one sharded cache per directory so concurrent writers rarely contend for a lock."""
+    return diskcache.FanoutCache(directory, shards=8)
+
+
+def _enabled() -> bool:
+    """Whether the response cache is on; read per call so it can be toggled without a restart."""
+    return os.getenv("ADK_NOCACHE") != "1"
+
+
+def _schema_json(schema: Any) -> Any:
+    """Turn a response schema (a pydantic model class or a genai schema) into plain JSON."""
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return schema.model_json_schema()
+    if isinstance(schema, BaseModel):
+        return schema.model_dump(mode="json", exclude_none=True)
+    return schema
+
+
+def request_key(llm_request: LlmRequest) -> str:
+    """
+    Compute the cache key of a model request.
+
+    The key covers the model, the contents (including inline image bytes), the system instruction,
+    the generation settings, the tool declarations and the response schema, so editing an
+    instruction or a schema is a miss.
+
+    Args:
+        llm_request (LlmRequest): The request about to be sent to the model.
+
+    Returns:
+        str: The BLAKE2b hex digest of the canonical JSON of the request.
+    """
+    config = llm_request.config
+    payload = {
+        "model": llm_request.model,
+        "contents": [content.model_dump(mode="json", exclude_none=True) for content in llm_request.contents],
+        "config": config.model_dump(mode="json", exclude_none=True, exclude={"response_schema", "http_options"}),
+        "response_schema": _schema_json(config.response_schema),
+    }
+    return hashlib.blake2b(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def cached_response(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """
+    Before-model callback that answers a request from the cache when it was seen before.
+
+    Args:
+        callback_context (CallbackContext): The callback context; used to remember the request key.
+        llm_request (LlmRequest): The request about to be sent to the model.
+
+    Returns:
+        Optional[LlmResponse]: The stored response, or None to call the model.
+    """
+    if not _enabled():
+        return None
+    key = request_key(llm_request)
+    callback_context.state[_KEY_STATE.format(agent=callback_context.agent_name)] = key
+    cached = _open_cache(CACHE_DIR).get(key)
+    return LlmResponse.model_validate_json(cached) if cached is not None else None
+
+
+def store_response(callback_context: CallbackContext, llm_response: LlmResponse) -> Optional[LlmResponse]:
+    """
+    After-model callback that writes a complete, successful response through to the cache.
+
+    Only responses that finished with `STOP` are stored: a candidate cut off at `MAX_TOKENS` still
+    has content and no error code, and replaying its truncated JSON would fail on every run.
+
+    Args:
+        callback_context (CallbackContext): The callback context holding the request key.
+        llm_response (LlmResponse): The model response.
+
+    Returns:
+        Optional[LlmResponse]: Always None, so the response is used as is.
+    """
+    key = callback_context.state.get(_KEY_STATE.format(agent=callback_context.agent_name))
+    if (
+        not _enabled()
+        or not key
+        or llm_response.partial
+        or llm_response.error_code
+        or llm_response.finish_reason != types.FinishReason.STOP
+        or not llm_response.content
+    ):
+        return None
+    _open_cache(CACHE_DIR).set(key, llm_response.model_dump_json(exclude_none=True), expire=TTL_SECONDS)
+    return None
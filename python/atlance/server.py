@@ -0,0 +1,107 @@
+import json
+import re
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from google.adk.agents.run_config import RunConfig, StreamingMode
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+from pydantic import BaseModel, ValidationError
+from typing import AsyncIterator, Optional
+
+from .agent import root_agent
+from .sub_agents.question_asker.agent import QuestionResponse, question_asker
+
+# The question asker answers in JSON; this matches the (possibly unfinished) question string.
+_QUESTION_PREFIX = re.compile(r'^\s*\{\s*"question"\s*:\s*"((?:[^"\\]|\\.)*)')
+
+
+class StreamRequest(BaseModel):
+    """A user turn: text and/or images, optionally continuing an existing session."""
+
+    user_id: str
+    session_id: Optional[str] = None
+    new_message: types.Content
+
+
+def partial_question(buffer: str) -> str:
+    """
+    Decode as much of the question as the streamed JSON so far contains.
+
+    Args:
+        buffer (str): The concatenated partial JSON text of the question asker.
+
+    Returns:
+        str: The decoded question text received so far, or an empty string.
+    """
+    match = _QUESTION_PREFIX.match(buffer)
+    if not match:
+        return ""
+    text = match.group(1)
+    # An odd run of trailing backslashes means an escape sequence has not fully arrived yet.
+    escape = re.search(r"(\\+)(u[0-9a-fA-F]{0,3})?$", text)
+    if escape and len(escape.group(1)) % 2:
+        text = text[: escape.end(1) - 1]
+    return json.loads(f'"{text}"')
+
+
+def _sse(event: str, data: dict) -> str:
+    """Format one server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+app = FastAPI(title="Atlance")
+runner = InMemoryRunner(agent=root_agent, app_name="atlance")
+
+
+async def stream_turn(request: StreamRequest) -> AsyncIterator[str]:
+    """
+    Run one user turn and stream the question to the client as it is generated.
+
+    Emits a `session` event first, `delta` events with new question text while the question asker
+    streams, and a final `question` event with the complete validated question. When the final
+    answer is not a valid question (e.g. cut off by the output token cap), an `error` event carrying
+    the question text decoded so far replaces the `question` event.
+
+    Only the fixed pipeline streams questions: with `ATLANCE_DYNAMIC_ROUTING=1` the question asker
+    runs inside an `AgentTool`, its events do not reach this runner, and only the `session` event
+    is sent.
+
+    Args:
+        request (StreamRequest): The user turn.
+
+    Yields:
+        str: Server-sent events.
+    """
+    session_id = request.session_id
+    if session_id is None:
+        session = await runner.session_service.create_session(app_name=runner.app_name, user_id=request.user_id)
+        session_id = session.id
+    yield _sse("session", {"session_id": session_id})
+
+    buffer, sent = "", ""
+    async for event in runner.run_async(
+        user_id=request.user_id,
+        session_id=session_id,
+        new_message=request.new_message,
+        run_config=RunConfig(streaming_mode=StreamingMode.SSE),
+    ):
+        if event.author != question_asker.name or not event.content or not event.content.parts:
+            continue
+        text = "".join(part.text for part in event.content.parts if part.text and not part.thought)
+        if event.partial:
+            buffer += text
+            question = partial_question(buffer)
+            if len(question) > len(sent):
+                yield _sse("delta", {"text": question[len(sent) :]})
+                sent = question
+        elif text.strip():
+            try:
+                yield _sse("question", QuestionResponse.model_validate_json(text).model_dump())
+            except ValidationError:
+                yield _sse("error", {"message": "incomplete question", "partial_question": partial_question(text)})
+
+
+@app.post("/stream")
+async def stream(request: StreamRequest) -> StreamingResponse:
+    """Stream a user turn as server-sent events so the UI shows the question from the first token."""
+    return StreamingResponse(stream_turn(request), media_type="text/event-stream")
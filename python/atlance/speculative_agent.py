@@ -0,0 +1,86 @@
+import asyncio
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.events.event import Event
+from typing import AsyncGenerator, List
+
+
+class SpeculativeAgent(BaseAgent):
+    """
+    Runs identical copies of an agent concurrently and keeps the first one that finishes.
+
+    The sub-agents must be interchangeable (same instruction and output schema). Their events are
+    buffered, so only the winner's events reach the session and the losers never write state.
+
+    Buffering also means a copy never sees its own events while it runs, so only agents that answer
+    with a single model call can be raced. An `LlmAgent` with tools rebuilds each request from the
+    session and would never see its function responses; `speculate` rejects those.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        """
+        Race the sub-agents and replay the events of the first one that completes without error.
+
+        Args:
+            ctx (InvocationContext): The invocation context shared by all copies.
+
+        Yields:
+            Event: The events of the winning copy, in order.
+
+        Raises:
+            Exception: The error of the first copy when every copy failed.
+        """
+
+        async def collect(agent: BaseAgent) -> List[Event]:
+            return [event async for event in agent.run_async(ctx)]
+
+        pending = {asyncio.create_task(collect(agent)) for agent in self.sub_agents}
+        errors: List[BaseException] = []
+        winner: List[Event] | None = None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Read every finished task's exception, even after a winner, so none goes unretrieved.
+                for task in done:
+                    error = task.exception()
+                    if error is not None:
+                        errors.append(error)
+                    elif winner is None:
+                        winner = task.result()
+        finally:
+            # Cancel the slower copies so they stop streaming (and billing) tokens.
+            for task in pending:
+                task.cancel()
+        if winner is None:
+            raise errors[0]
+        for event in winner:
+            yield event
+
+
+def speculate(agent: BaseAgent, n: int) -> BaseAgent:
+    """
+    Wrap an agent so that `n` copies of it race on every invocation.
+
+    Only single-call agents can be raced, since the copies' events are buffered until one wins
+    (see `SpeculativeAgent`).
+
+    Args:
+        agent (BaseAgent): The agent to copy. It must not have a parent yet.
+        n (int): The number of concurrent copies; 1 or less returns the agent unchanged.
+
+    Returns:
+        BaseAgent: A `SpeculativeAgent` with the agent's name, or the agent itself.
+
+    Raises:
+        ValueError: If the agent is an `LlmAgent` with tools, which needs its own events mid-run.
+    """
+    if n <= 1:
+        return agent
+    if isinstance(agent, LlmAgent) and agent.tools:
+        raise ValueError(f"Cannot speculate {agent.name}: agents with tools need several model calls.")
+    return SpeculativeAgent(
+        name=agent.name,
+        description=agent.description,
+        sub_agents=[agent.clone(update={"name": f"{agent.name}_{i}"}) for i in range(n)],
+    )
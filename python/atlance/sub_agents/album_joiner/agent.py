@@ -0,0 +1,61 @@
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events.event import Event, EventActions
+from google.genai import types
+from typing import Any, AsyncGenerator, Dict
+
+from ..data_extractor_agent.agent import ImagesOnlyResponse
+from ..duplicate_remover_agent.agent import ImageSelectionResponse
+
+
+def select_images(extraction: Dict[str, Any], selection: Dict[str, Any]) -> ImagesOnlyResponse:
+    """
+    Keep only the extracted images that the duplicate remover selected.
+
+    Args:
+        extraction (Dict[str, Any]): The `ImagesOnlyResponse` stored by the data extractor.
+        selection (Dict[str, Any]): The `ImageSelectionResponse` stored by the duplicate remover.
+
+    Returns:
+        ImagesOnlyResponse: The extraction restricted to the selected indices, in selection order.
+            Indices that do not refer to an extracted image are ignored.
+    """
+    extracted = ImagesOnlyResponse.model_validate(extraction)
+    selected = ImageSelectionResponse.model_validate(selection)
+    images = [extracted.images[i] for i in selected.selected_indices if 0 <= i < len(extracted.images)]
+    return ImagesOnlyResponse(images=images)
+
+
+class AlbumJoinerAgent(BaseAgent):
+    """Joins the outputs of the parallel duplicate remover and data extractor without a model call."""
+
+    selection_key: str = "dedupe"
+    extraction_key: str = "extract"
+    output_key: str = "album"
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        """
+        Filter the extracted images by the selected indices and store the result in session state.
+
+        Args:
+            ctx (InvocationContext): The invocation context; both upstream outputs are read from its session state.
+
+        Yields:
+            Event: A single event carrying the joined `ImagesOnlyResponse` as JSON, in its text and in
+                the `output_key` state.
+        """
+        album = select_images(ctx.session.state[self.extraction_key], ctx.session.state[self.selection_key])
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            branch=ctx.branch,
+            content=types.Content(role="model", parts=[types.Part(text=album.model_dump_json())]),
+            # Stored as JSON, so the story agent's `{album?}` placeholder renders it as JSON, not a dict repr.
+            actions=EventActions(state_delta={self.output_key: album.model_dump_json(exclude_none=True)}),
+        )
+
+
+album_joiner = AlbumJoinerAgent(
+    name="album_joiner",
+    description="Keeps the extracted data of the images selected by the duplicate remover.",
+)
@@ -1,7 +1,15 @@
+import asyncio
+from collections import OrderedDict
 from google.adk.agents.llm_agent import LlmAgent, Agent
 from google.adk.tools import google_search, agent_tool
+from google.adk.tools.function_tool import FunctionTool
+from google.adk.tools.tool_context import ToolContext
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+
+from ...images import annotate_request_exif, downscale_request_images
+from ...models import gemini
+from ...response_cache import cached_response, store_response
 
 
 class Location(BaseModel):
@@ -15,66 +23,124 @@ class ImageAnalysis(BaseModel):
     """Analysis result for a single image."""
 
     path: str
-    timestamp: Optional[str]
-    location: Optional[Location]
+    # ADK stores `output_key` state with exclude_none, so null values arrive as missing keys.
+    timestamp: Optional[str] = None
+    location: Optional[Location] = None
     subjects: List[str]
 
 
-class DataExtractionResponse(BaseModel):
+class ImagesOnlyResponse(BaseModel):
     """Schema for the agent's response when extracting data from images."""
 
     images: List[ImageAnalysis]
+
+
+class DataExtractionResponse(ImagesOnlyResponse):
+    """The extracted images together with a preliminary story, written separately by the story agent."""
+
     preliminary_story: str
 
 
 Agent_Search = Agent(
-    model="gemini-2.5-flash",
+    model=gemini("gemini-2.5-flash"),
     name="SearchAgent",
     instruction="""
     You're a specialist in Google Search
     """,
     tools=[google_search],
+    before_model_callback=cached_response,
+    after_model_callback=store_response,
 )
 
+# One shared tool instance runs every lookup against the same search agent.
+_search_tool = agent_tool.AgentTool(agent=Agent_Search)
+
+# Each search is a serial round trip on the critical path, so searches are capped per invocation
+# and repeated queries are answered from memory (cached answers do not count against the budget).
+SEARCH_BUDGET = 5
+_SEARCH_CALLS_STATE = "temp:search_calls"
+_SEARCH_CACHE_SIZE = 256
+_search_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def _remember(query: str, answer: str) -> None:
+    """Store an answer in the in-process LRU cache of search results."""
+    _search_cache[query] = answer
+    _search_cache.move_to_end(query)
+    while len(_search_cache) > _SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+
+
+async def batch_google_search(queries: List[str], tool_context: ToolContext) -> Dict[str, Any]:
+    """
+    Run several Google searches concurrently in a single tool call.
+
+    Duplicate queries are searched once, previously seen queries come from memory, and at most
+    `SEARCH_BUDGET` new searches run per invocation.
+
+    Args:
+        queries (List[str]): The search queries, e.g. landmark names or "what is at 51.92, 4.48".
+        tool_context (ToolContext): The tool context of the calling agent, provided by ADK.
+
+    Returns:
+        Dict[str, Any]: `{"results": {query: answer}}`, plus an `"error"` listing the queries that
+            were skipped once the budget ran out.
+    """
+    unique = list(dict.fromkeys(query.strip() for query in queries if query.strip()))
+    results = {query: _search_cache[query] for query in unique if query in _search_cache}
+    for query in results:
+        _search_cache.move_to_end(query)
+
+    used = tool_context.state.get(_SEARCH_CALLS_STATE, 0)
+    new = [query for query in unique if query not in results]
+    allowed, skipped = new[: max(SEARCH_BUDGET - used, 0)], new[max(SEARCH_BUDGET - used, 0) :]
+    tool_context.state[_SEARCH_CALLS_STATE] = used + len(allowed)
+
+    answers = await asyncio.gather(
+        *(_search_tool.run_async(args={"request": query}, tool_context=tool_context) for query in allowed)
+    )
+    for query, answer in zip(allowed, answers):
+        results[query] = str(answer)
+        _remember(query, results[query])
+
+    response: Dict[str, Any] = {"results": results}
+    if skipped:
+        response["error"] = f"search budget exhausted; not searched: {skipped}. Finish without further searches."
+    return response
+
+
+# Condensed by hand, LLMLingua-style: filler words dropped, schema keywords (path, timestamp,
+# lat, lng, ISO 8601, null) kept verbatim. The instruction is sent on every call. The search limit
+# comes from SEARCH_BUDGET so the prompt and the tool agree.
+DATA_EXTRACTOR_INSTRUCTION = f"""
+    Analyze travel photos; extract data.
+
+    Per image:
+    1. Metadata: each image is followed by an "EXIF of image N" line with timestamp and location lat, lng (and path, else use the file path given with the image). Copy these values into the image's analysis as given; never guess them. Only infer subjects.
+    2. Subjects: landmarks (e.g. Eiffel Tower), natural features (mountains, beaches, parks), activities (dining, hiking, sightseeing), people/groups, notable architecture.
+
+    Tool: search locations, landmarks, dates or coordinates to name subjects precisely.
+    Collect all search queries for all images first, then call batch_google_search once with the list. At most {SEARCH_BUDGET} new searches per turn: search only what the images and EXIF cannot tell you. If the tool reports the search budget is exhausted, answer without searching.
+
+    Rules:
+    - Be specific on landmarks/locations; verify names with Google Search
+    - Add general subjects ("sunset", "food", "architecture") when fitting
+    - No EXIF location: location null
+    - No EXIF timestamp: timestamp null (EXIF timestamps are already ISO 8601)
+    """
+
+
 data_extractor_agent = LlmAgent(
-    model="gemini-2.5-flash",
+    model=gemini("gemini-2.5-flash"),
     name="data_extractor_agent",
     description="An agent that extracts metadata and identifies subjects in travel photos.",
-    instruction="""
-    You are an agent that analyzes travel photos to extract meaningful data.
-
-    Your task is to:
-    1. Extract metadata from each image:
-       - File path
-       - Timestamp (when the photo was taken)
-       - Location coordinates (latitude, longitude) if available from EXIF data
-
-    2. Identify recognizable subjects in each image:
-       - Landmarks (e.g., Eiffel Tower, Statue of Liberty)
-       - Natural features (e.g., mountains, beaches, parks)
-       - Activities (e.g., dining, hiking, sightseeing)
-       - People or groups
-       - Architecture or notable buildings
-
-    3. Generate a preliminary story description:
-       - Write a brief 1-2 sentence summary of the trip based on the images
-       - Focus on the main destinations, activities, and overall theme
-       - Keep it concise and engaging
-
-    Tool:
-    You can search to flesh out the additional story with additional information about locations, landmarks, or dates from the image metadata to enhance your analysis and provide more context about the places and events captured in the photos.
-
-    Guidelines:
-    - Be specific when identifying landmarks or locations
-    - Use Google Search to verify landmark names or get additional context about locations from coordinates
-    - Search for historical events or significance of dates when relevant
-    - Include general subjects like "sunset", "food", "architecture" when appropriate
-    - If location data is not available, set location to null
-    - If timestamp data is not available, set timestamp to null
-    - Use ISO 8601 format for timestamps when available (e.g., "2024-10-20T18:45:00Z")
-    - Make the preliminary story engaging but factual based on what you see
-    - When you find interesting historical or cultural information through search, incorporate it into your analysis
-    """,
-    output_schema=DataExtractionResponse,
-    tools=[agent_tool.AgentTool(agent=Agent_Search)],
+    instruction=DATA_EXTRACTOR_INSTRUCTION,
+    # No prose here: the story is written by the story agent off the critical path.
+    output_schema=ImagesOnlyResponse,
+    output_key="extract",
+    tools=[FunctionTool(batch_google_search)],
+    # EXIF is read before downscaling so no metadata is lost to re-encoding; the cache is keyed on
+    # the request as it is finally sent.
+    before_model_callback=[annotate_request_exif, downscale_request_images, cached_response],
+    after_model_callback=store_response,
 )
@@ -0,0 +1,98 @@
+import asyncio
+import mimetypes
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+from typing import Any, Dict, List, Optional
+
+from ..story_agent.agent import story_agent
+from .agent import DataExtractionResponse, ImagesOnlyResponse, data_extractor_agent
+
+# The instruction is paid once per call, so images are sent together; very large albums are split
+# to stay within a comfortable request size.
+MAX_IMAGES_PER_CALL = 16
+
+# Chunks run concurrently, but no more than this many at once to stay under the provider's QPS cap.
+MAX_CONCURRENT_CALLS = 8
+
+# A parentless copy, so the album helper can run the extractor outside the root pipeline.
+_runner = InMemoryRunner(agent=data_extractor_agent.clone(), app_name="atlance_album")
+
+# The story is written once from the merged analysis of every chunk, by the same agent as in the pipeline.
+_story_runner = InMemoryRunner(agent=story_agent.clone(), app_name="atlance_album")
+
+
+def album_content(paths: List[str]) -> types.Content:
+    """
+    Pack images into a single user message, each preceded by its index and path.
+
+    Args:
+        paths (List[str]): Local image file paths.
+
+    Returns:
+        types.Content: One user content with an "Image N: path" text part before every image.
+    """
+    parts = []
+    for i, path in enumerate(paths):
+        with open(path, "rb") as f:
+            data = f.read()
+        parts.append(types.Part(text=f"Image {i}: {path}"))
+        parts.append(types.Part.from_bytes(data=data, mime_type=mimetypes.guess_type(path)[0] or "image/jpeg"))
+    return types.Content(role="user", parts=parts)
+
+
+async def _final_text(runner: InMemoryRunner, message: types.Content, state: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Run an agent once in a fresh session, seeded with `state`, and return the text of its final response.
+
+    The session is deleted afterwards: it holds the message with every image's bytes, and the
+    runners live as long as the process.
+    """
+    session = await runner.session_service.create_session(app_name=runner.app_name, user_id="album", state=state)
+    final_text = ""
+    try:
+        async for event in runner.run_async(user_id="album", session_id=session.id, new_message=message):
+            if event.is_final_response() and event.content and event.content.parts:
+                final_text = "".join(part.text for part in event.content.parts if part.text and not part.thought)
+    finally:
+        await runner.session_service.delete_session(app_name=runner.app_name, user_id="album", session_id=session.id)
+    return final_text
+
+
+async def _analyze_chunk(paths: List[str]) -> ImagesOnlyResponse:
+    """Run the extractor once on up to `MAX_IMAGES_PER_CALL` images."""
+    return ImagesOnlyResponse.model_validate_json(await _final_text(_runner, album_content(paths)))
+
+
+async def _write_story(analysis: ImagesOnlyResponse) -> str:
+    """Write the preliminary story of the whole album with one short text-only call."""
+    message = types.Content(role="user", parts=[types.Part(text="Write the preliminary story.")])
+    return (
+        await _final_text(_story_runner, message, state={"album": analysis.model_dump_json(exclude_none=True)})
+    ).strip()
+
+
+async def analyze_album(paths: List[str]) -> DataExtractionResponse:
+    """
+    Analyse a whole album with one extractor call per `MAX_IMAGES_PER_CALL` images.
+
+    Callers should use this instead of calling the extractor per image, which pays the instruction
+    prefill once per image. Chunks of a large album are analysed concurrently, at most
+    `MAX_CONCURRENT_CALLS` at a time.
+
+    Args:
+        paths (List[str]): Local image file paths, in album order.
+
+    Returns:
+        DataExtractionResponse: The analysis of all images in album order, with a preliminary story
+            written by `story_agent` from the merged analysis.
+    """
+    chunks = [paths[i : i + MAX_IMAGES_PER_CALL] for i in range(0, len(paths), MAX_IMAGES_PER_CALL)]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+
+    async def one(chunk: List[str]) -> ImagesOnlyResponse:
+        async with semaphore:
+            return await _analyze_chunk(chunk)
+
+    results = await asyncio.gather(*(one(chunk) for chunk in chunks))
+    analysis = ImagesOnlyResponse(images=[image for result in results for image in result.images])
+    return DataExtractionResponse(images=analysis.images, preliminary_story=await _write_story(analysis))
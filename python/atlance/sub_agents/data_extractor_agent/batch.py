@@ -0,0 +1,142 @@
+import base64
+import json
+import mimetypes
+import os
+import uuid
+from typing import Any, Dict, Iterable, List
+
+from ...images import read_exif
+from .agent import DATA_EXTRACTOR_INSTRUCTION, ImagesOnlyResponse
+
+# Batch prediction runs the same model as the interactive agent at a discount and
+# with higher rate limits; the shared system prompt is implicitly cached.
+BATCH_MODEL = "publishers/google/models/gemini-2.5-flash"
+
+
+def _image_parts(path: str) -> List[Dict[str, Any]]:
+    """
+    Build the request parts for one image.
+
+    Args:
+        path (str): A `gs://` URI or a local file path.
+
+    Returns:
+        List[Dict[str, Any]]: A `fileData` part for GCS objects. Local files are inlined and followed
+            by their EXIF metadata, as in the interactive agent.
+    """
+    mime_type = mimetypes.guess_type(path)[0] or "image/jpeg"
+    if path.startswith("gs://"):
+        return [{"fileData": {"fileUri": path, "mimeType": mime_type}}]
+    with open(path, "rb") as f:
+        data = f.read()
+    return [
+        {"inlineData": {"mimeType": mime_type, "data": base64.b64encode(data).decode("ascii")}},
+        {"text": f"EXIF of image 0: {json.dumps({'path': path, **read_exif(data)})}"},
+    ]
+
+
+def _path_text(path: str) -> str:
+    """Text part that tells the model the file path and lets results be matched back to their input."""
+    return f"Image path: {path}"
+
+
+def build_request_row(path: str) -> Dict[str, Any]:
+    """
+    Build one batch prediction input row for an image.
+
+    Args:
+        path (str): A `gs://` URI or a local file path.
+
+    Returns:
+        Dict[str, Any]: A `{"request": GenerateContentRequest}` row with the extractor instruction and schema.
+    """
+    return {
+        "request": {
+            "systemInstruction": {"parts": [{"text": DATA_EXTRACTOR_INSTRUCTION}]},
+            "contents": [{"role": "user", "parts": [{"text": _path_text(path)}, *_image_parts(path)]}],
+            "generationConfig": {
+                "responseMimeType": "application/json",
+                "responseJsonSchema": ImagesOnlyResponse.model_json_schema(),
+            },
+        }
+    }
+
+
+def parse_prediction_rows(rows: Iterable[Dict[str, Any]], paths: List[str]) -> ImagesOnlyResponse:
+    """
+    Merge batch prediction output rows into a single extraction result.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): The parsed output JSONL rows, in any order.
+        paths (List[str]): The input paths, which define the order of the merged images.
+
+    Returns:
+        ImagesOnlyResponse: All analysed images in input order.
+
+    Raises:
+        RuntimeError: If a row failed or an input image has no result.
+    """
+    order = {_path_text(path): i for i, path in enumerate(paths)}
+    results: Dict[int, ImagesOnlyResponse] = {}
+    for row in rows:
+        index = order[row["request"]["contents"][0]["parts"][0]["text"]]
+        if row.get("status"):
+            raise RuntimeError(f"Batch prediction failed for {paths[index]}: {row['status']}")
+        parts = row["response"]["candidates"][0]["content"]["parts"]
+        results[index] = ImagesOnlyResponse.model_validate_json("".join(p.get("text", "") for p in parts))
+
+    missing = [path for i, path in enumerate(paths) if i not in results]
+    if missing:
+        raise RuntimeError(f"Batch prediction returned no result for {missing}")
+
+    return ImagesOnlyResponse(images=[image for i in range(len(paths)) for image in results[i].images])
+
+
+def data_extractor_agent_batch(paths: List[str], gcs_prefix: str) -> ImagesOnlyResponse:
+    """
+    Analyse a known set of images with a Vertex AI batch prediction job instead of live agent calls.
+
+    Each image becomes one request with the same instruction as `data_extractor_agent`. EXIF is
+    only attached for local files, so GCS images get null timestamps and locations. Batch
+    requests cannot call the search agent, so subjects rely on the model alone. Blocks until the
+    job finishes; use the `LlmAgent` for interactive runs. The preliminary story is left to
+    `story_agent`.
+
+    Args:
+        paths (List[str]): The images to analyse, as `gs://` URIs or local file paths.
+        gcs_prefix (str): A `gs://bucket/prefix` under which the job input and output are written.
+
+    Returns:
+        ImagesOnlyResponse: The analysis of all images, in input order.
+    """
+    # The Vertex AI SDK is slow to import and only needed here, not by the interactive agents.
+    from google.cloud import aiplatform, storage
+
+    run_prefix = f"{gcs_prefix.rstrip('/')}/{uuid.uuid4().hex}"
+    bucket_name, _, input_prefix = run_prefix.removeprefix("gs://").partition("/")
+    bucket = storage.Client().bucket(bucket_name)
+    bucket.blob(f"{input_prefix}/input.jsonl").upload_from_string(
+        "\n".join(json.dumps(build_request_row(path)) for path in paths),
+        content_type="application/jsonl",
+    )
+
+    job = aiplatform.BatchPredictionJob.create(
+        job_display_name="data_extractor_agent_batch",
+        model_name=BATCH_MODEL,
+        instances_format="jsonl",
+        predictions_format="jsonl",
+        gcs_source=f"{run_prefix}/input.jsonl",
+        gcs_destination_prefix=f"{run_prefix}/output",
+        project=os.getenv("GOOGLE_CLOUD_PROJECT"),
+        location=os.getenv("GOOGLE_CLOUD_LOCATION"),
+    )
+
+    output_prefix = job.output_info.gcs_output_directory.removeprefix(f"gs://{bucket_name}/")
+    rows = [
+        json.loads(line)
+        for blob in bucket.list_blobs(prefix=output_prefix)
+        if blob.name.endswith(".jsonl")
+        for line in blob.download_as_text().splitlines()
+        if line.strip()
+    ]
+    return parse_prediction_rows(rows, paths)
@@ -0,0 +1,3 @@
+from .agent import ImageSelectionResponse, duplicate_remover_agent
+
+__all__ = ["ImageSelectionResponse", "duplicate_remover_agent"]
@@ -1,25 +1,51 @@
-from google.adk.agents.llm_agent import Agent
+import os
+from google.adk.planners import BuiltInPlanner
+from google.genai import types
 from pydantic import BaseModel
 from typing import List
 
+from ...models import gemini
+from ...response_cache import cached_response, store_response
+from ...speculative_agent import speculate
+from .cache import CachedSelectionAgent
+
 
 class ImageSelectionResponse(BaseModel):
-    """Schema for the agent's response when selecting interesting images."""
+    """
+    Schema for the agent's response when selecting interesting images.
+
+    Downstream agents only use the indices, so the response carries no free-form reasoning:
+    every output token adds to the decode time of this call.
+    """
 
     selected_indices: List[int]
-    reasons: str
 
 
-duplicate_remover_agent = Agent(
-    model="gemini-2.5-flash",
+# Number of concurrent copies racing on every call; the first answer wins. Each
+# extra copy trades tokens for a shorter latency tail, so keep it small.
+SPEC_N = int(os.getenv("SPEC_N", "2"))
+
+duplicate_remover_template = CachedSelectionAgent(
+    model=gemini("gemini-2.5-flash"),
     name="duplicate_remover_agent",
     description="A helpful assistant for user questions.",
     instruction="""
     You are an agent that receives pictures from the user.
     Your task is to identify the 3 most interesting distinct images in the pictures provided. Do not select photos that convey negative emotions or that are inappropriate (e.g., discriminatory, sexually suggestive, etc.).
-    You should return the indices of the selected images (where 0 is the first element) along with your reasoning for the selection.
+    You should return only the indices of the selected images (where 0 is the first element).
     """,
     output_schema=ImageSelectionResponse,
+    output_key="dedupe",
+    # ADK adds the output schema as response_schema itself (it rejects one set here), which
+    # turns on constrained JSON decoding for agents without tools.
+    # A handful of indices fits well within 64 tokens. Thinking is off, since thought tokens would
+    # count against that budget.
+    generate_content_config=types.GenerateContentConfig(response_mime_type="application/json", max_output_tokens=64),
+    planner=BuiltInPlanner(thinking_config=types.ThinkingConfig(thinking_budget=0)),
     disallow_transfer_to_parent=True,
     disallow_transfer_to_peers=True,
+    before_model_callback=cached_response,
+    after_model_callback=store_response,
 )
+
+duplicate_remover_agent = speculate(duplicate_remover_template, n=SPEC_N)
@@ -0,0 +1,115 @@
+import functools
+import hashlib
+from typing import List, Optional
+
+import diskcache  # Persistent key-value store that survives restarts of the ADK web server.
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from PIL import Image
+from pydantic import ValidationError
+
+from ...phash import image_phash
+
+# Session state key that carries the cache key from the request to the response callback.
+# The `temp:` prefix keeps it out of the persisted session.
+_KEY_STATE = "temp:selection_cache_key"
+
+
+@functools.lru_cache(maxsize=None)
+def _open_cache(directory: str) -> diskcache.Cache:
+    """Open one cache per directory and share it between agents and clones."""
+    return diskcache.Cache(directory)
+
+
+def image_set_key(images: List[bytes]) -> str:
+    """
+    Compute a content-addressed key for an ordered list of images.
+
+    Args:
+        images (List[bytes]): The encoded image files, in the order the model sees them.
+
+    Returns:
+        str: The BLAKE2b hex digest of the concatenated 64-bit perceptual hashes; re-encoded or
+            resized copies of the same photos share a key.
+    """
+    hashes = (image_phash(data).to_bytes(8, "big") for data in images)
+    return hashlib.blake2b(b"".join(hashes)).hexdigest()
+
+
+def _request_images(llm_request: LlmRequest) -> List[bytes]:
+    """Collect the inline image bytes of a request, in order."""
+    return [
+        part.inline_data.data
+        for content in llm_request.contents
+        for part in content.parts or []
+        if part.inline_data and part.inline_data.data and (part.inline_data.mime_type or "").startswith("image/")
+    ]
+
+
+class CachedSelectionAgent(LlmAgent):
+    """
+    An image selection agent that skips the model for image sets it has selected from before.
+
+    The cache is keyed on the perceptual hashes of the request images only, so the same album
+    uploaded again returns the stored selection without a model call. Requests without images, or
+    with an image that cannot be decoded, always reach the model.
+    """
+
+    cache_dir: str = ".selcache"
+
+    @property
+    def canonical_before_model_callbacks(self):
+        """Look up the selection before any user-provided callback runs."""
+        return [self._cached_selection, *super().canonical_before_model_callbacks]
+
+    @property
+    def canonical_after_model_callbacks(self):
+        """Store fresh selections after any user-provided callback ran."""
+        return [*super().canonical_after_model_callbacks, self._store_selection]
+
+    def _cached_selection(self, callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+        """
+        Return the stored selection for the request images, if any.
+
+        Args:
+            callback_context (CallbackContext): The callback context; used to remember the key.
+            llm_request (LlmRequest): The request about to be sent to the model.
+
+        Returns:
+            Optional[LlmResponse]: The cached selection as a model response, or None on a miss.
+        """
+        images = _request_images(llm_request)
+        try:
+            key = image_set_key(images) if images else None
+        except (OSError, Image.DecompressionBombError):
+            # An image Pillow cannot decode (e.g. HEIC) makes the request uncacheable, never fail.
+            key = None
+        callback_context.state[_KEY_STATE] = key
+        if key is None:
+            return None
+        cached = _open_cache(self.cache_dir).get(key)
+        if cached is None:
+            return None
+        return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=cached)]))
+
+    def _store_selection(self, callback_context: CallbackContext, llm_response: LlmResponse) -> None:
+        """
+        Write a complete, schema-valid selection through to the cache.
+
+        Args:
+            callback_context (CallbackContext): The callback context holding the key of the request.
+            llm_response (LlmResponse): The model response.
+        """
+        key = callback_context.state.get(_KEY_STATE)
+        if not key or llm_response.partial or not llm_response.content or not llm_response.content.parts:
+            return None
+        text = "".join(part.text for part in llm_response.content.parts if part.text and not part.thought)
+        try:
+            selection = self.output_schema.model_validate_json(text)
+        except ValidationError:
+            return None
+        _open_cache(self.cache_dir).set(key, selection.model_dump_json())
+        return None
@@ -1,8 +1,19 @@
 from google.adk.agents.llm_agent import Agent
+from google.genai import types
+from pydantic import BaseModel
+
+from ...models import gemini
+from ...response_cache import cached_response, store_response
+
+
+class QuestionResponse(BaseModel):
+    """Schema for the agent's response: the single question to ask the user."""
+
+    question: str
 
 
 question_asker = Agent(
-    model="gemini-2.5-flash",
+    model=gemini("gemini-2.5-flash-lite"),
     name="question_asker",
     description="A helpful assistant for user questions.",
     instruction="""
@@ -18,4 +29,13 @@ question_asker = Agent(
 
     Ask only one question at a time and wait for the user's response before asking another question.
     """,
+    output_schema=QuestionResponse,
+    disallow_transfer_to_parent=True,
+    disallow_transfer_to_peers=True,
+    before_model_callback=cached_response,
+    after_model_callback=store_response,
+    # A single short question needs neither the larger model nor a long output budget.
+    generate_content_config=types.GenerateContentConfig(
+        response_mime_type="application/json", max_output_tokens=80, temperature=0.4
+    ),
 )
@@ -0,0 +1,27 @@
+from google.adk.agents.llm_agent import Agent
+from google.genai import types
+
+from ...models import gemini
+from ...response_cache import cached_response, store_response
+
+
+story_agent = Agent(
+    model=gemini("gemini-2.5-flash-lite"),
+    name="story_agent",
+    description="Writes a short preliminary story of the trip from the analysed images.",
+    instruction="""
+    You receive the analysis of travel photos (paths, timestamps, locations and subjects):
+    {album?}
+
+    If no analysis is given above, base the story on the photos and messages in the conversation instead.
+    Write a preliminary story of the trip in exactly 2 concise, engaging sentences.
+    Focus on the main destinations, activities and overall theme, and stay factual to the analysis.
+    Reply with the story only.
+    """,
+    output_key="preliminary_story",
+    generate_content_config=types.GenerateContentConfig(max_output_tokens=120),
+    disallow_transfer_to_parent=True,
+    disallow_transfer_to_peers=True,
+    before_model_callback=cached_response,
+    after_model_callback=store_response,
+)
@@ -1,6 +1,24 @@
 """Basic tests for the Atlance agent."""
 
+import subprocess
+import sys
+
 
 def test_basic():
     """A placeholder test to ensure pytest can run."""
     assert True
+
+
+def test_package_import_does_not_build_agents():
+    """Importing a helper module leaves the agent graph unbuilt until `root_agent` is accessed."""
+    code = "import sys, atlance, atlance.images; assert 'atlance.agent' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_build_agent_can_be_called_again():
+    """Both routing modes can be built next to the module-level root agent."""
+    from atlance.agent import build_agent, root_agent
+
+    assert build_agent(dynamic_routing=False).name == "blog_pipeline"
+    assert build_agent(dynamic_routing=True).name == "root_agent"
+    assert root_agent.sub_agents
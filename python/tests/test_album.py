@@ -0,0 +1,72 @@
+"""Tests for analysing a whole album with as few extractor calls as possible."""
+
+import asyncio
+
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.events.event import Event
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+from PIL import Image
+
+from atlance.sub_agents.data_extractor_agent import album
+from atlance.sub_agents.data_extractor_agent.agent import ImageAnalysis, ImagesOnlyResponse
+
+
+def test_album_is_packed_into_one_message(tmp_path):
+    """Every image gets an index and path prefix, in album order, in a single user content."""
+    paths = []
+    for name in ("a.jpg", "b.png"):
+        Image.new("RGB", (4, 4)).save(tmp_path / name)
+        paths.append(str(tmp_path / name))
+    content = album.album_content(paths)
+    assert content.role == "user"
+    assert [part.text for part in content.parts[::2]] == [f"Image 0: {paths[0]}", f"Image 1: {paths[1]}"]
+    assert [part.inline_data.mime_type for part in content.parts[1::2]] == ["image/jpeg", "image/png"]
+
+
+def test_large_album_is_split_into_capped_chunks(monkeypatch):
+    """Albums above the per-call cap are analysed in chunks, with limited concurrency, and merged in order."""
+    calls, running, peak = [], 0, 0
+
+    async def fake_chunk(paths):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        calls.append(len(paths))
+        images = [ImageAnalysis(path=path, timestamp=None, location=None, subjects=[]) for path in paths]
+        return ImagesOnlyResponse(images=images)
+
+    async def fake_story(analysis):
+        return f"{len(analysis.images)} photos."
+
+    monkeypatch.setattr(album, "_analyze_chunk", fake_chunk)
+    monkeypatch.setattr(album, "_write_story", fake_story)
+    monkeypatch.setattr(album, "MAX_CONCURRENT_CALLS", 2)
+    paths = [f"{i}.jpg" for i in range(album.MAX_IMAGES_PER_CALL * 4 + 4)]
+    result = asyncio.run(album.analyze_album(paths))
+    assert sorted(calls) == [4] + [album.MAX_IMAGES_PER_CALL] * 4
+    assert peak == 2
+    assert [image.path for image in result.images] == paths
+    assert result.preliminary_story == f"{len(paths)} photos."
+
+
+class EchoAgent(BaseAgent):
+    """Answers every message with a fixed text, without a model call."""
+
+    async def _run_async_impl(self, ctx):
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            content=types.Content(role="model", parts=[types.Part(text="done")]),
+        )
+
+
+def test_album_sessions_are_deleted_after_the_run():
+    """The module-level runners do not keep sessions, and their image bytes, once a call returns."""
+    runner = InMemoryRunner(agent=EchoAgent(name="echo"), app_name="atlance_album")
+    message = types.Content(role="user", parts=[types.Part(text="Image 0")])
+    assert asyncio.run(album._final_text(runner, message)) == "done"
+    sessions = asyncio.run(runner.session_service.list_sessions(app_name="atlance_album", user_id="album"))
+    assert sessions.sessions == []
@@ -0,0 +1,26 @@
+"""Tests for joining the parallel duplicate remover and data extractor outputs."""
+
+from atlance.sub_agents.album_joiner.agent import select_images
+
+
+# As saved in session state: ADK drops null fields, so images without EXIF have no timestamp or location key.
+EXTRACTION = {
+    "images": [
+        {"path": "a.jpg", "subjects": ["beach"]},
+        {"path": "b.jpg", "subjects": ["beach"]},
+        {"path": "c.jpg", "location": {"lat": 51.92, "lng": 4.48}, "subjects": ["Erasmusbrug"]},
+    ],
+}
+
+
+def test_select_images_keeps_selection_order():
+    """Only the selected images are kept, in the order the duplicate remover returned them."""
+    album = select_images(EXTRACTION, {"selected_indices": [2, 0]})
+    assert [image.path for image in album.images] == ["c.jpg", "a.jpg"]
+    assert album.images[1].timestamp is None and album.images[1].location is None
+
+
+def test_select_images_ignores_out_of_range_indices():
+    """Indices the model made up do not break the join."""
+    album = select_images(EXTRACTION, {"selected_indices": [1, 5, -1]})
+    assert [image.path for image in album.images] == ["b.jpg"]
@@ -0,0 +1,38 @@
+"""Tests for the batch prediction rows of the data extractor."""
+
+import json
+import pytest
+
+from atlance.sub_agents.data_extractor_agent.batch import build_request_row, parse_prediction_rows
+
+
+def prediction_row(path: str, subject: str) -> dict:
+    """An output row as written by Vertex AI: the original request plus the model response."""
+    text = json.dumps({"images": [{"path": path, "timestamp": None, "location": None, "subjects": [subject]}]})
+    return {
+        **build_request_row(path),
+        "status": "",
+        "response": {"candidates": [{"content": {"role": "model", "parts": [{"text": text}]}}]},
+    }
+
+
+def test_gcs_images_are_referenced_not_inlined():
+    """Images already in GCS are passed by URI."""
+    parts = build_request_row("gs://album/a.jpg")["request"]["contents"][0]["parts"]
+    assert parts[1] == {"fileData": {"fileUri": "gs://album/a.jpg", "mimeType": "image/jpeg"}}
+
+
+def test_rows_are_merged_in_input_order():
+    """Output rows come back in any order but the merged images follow the input."""
+    paths = ["gs://album/a.jpg", "gs://album/b.png"]
+    rows = [prediction_row(paths[1], "harbour"), prediction_row(paths[0], "windmill")]
+    result = parse_prediction_rows(rows, paths)
+    assert [image.path for image in result.images] == paths
+    assert [image.subjects for image in result.images] == [["windmill"], ["harbour"]]
+
+
+def test_missing_row_is_an_error():
+    """An image without a result is reported instead of silently dropped."""
+    paths = ["gs://album/a.jpg", "gs://album/b.jpg"]
+    with pytest.raises(RuntimeError, match="b.jpg"):
+        parse_prediction_rows([prediction_row(paths[0], "windmill")], paths)
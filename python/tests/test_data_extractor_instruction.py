@@ -0,0 +1,29 @@
+"""Tests for the condensed data extractor instruction."""
+
+import re
+
+import pytest
+
+from atlance.sub_agents.data_extractor_agent.agent import (
+    DATA_EXTRACTOR_INSTRUCTION,
+    SEARCH_BUDGET,
+    ImageAnalysis,
+    Location,
+)
+
+
+@pytest.mark.parametrize("keyword", ["path", "timestamp", "lat", "lng", "ISO 8601", "null", "subjects"])
+def test_schema_keywords_survive_compression(keyword):
+    """The words the model needs to fill the response schema are kept verbatim."""
+    assert keyword in DATA_EXTRACTOR_INSTRUCTION
+
+
+@pytest.mark.parametrize("field", [*ImageAnalysis.model_fields, *Location.model_fields])
+def test_instruction_names_every_output_field(field):
+    """Every field the model fills per image is named verbatim, as a whole word."""
+    assert re.search(rf"\b{field}\b", DATA_EXTRACTOR_INSTRUCTION)
+
+
+def test_instruction_states_the_search_budget():
+    """The limit in the prompt is the one the search tool enforces."""
+    assert f"At most {SEARCH_BUDGET} new searches" in DATA_EXTRACTOR_INSTRUCTION
@@ -0,0 +1,71 @@
+"""Tests for preparing images and their metadata before they are sent to the model."""
+
+import io
+
+import pytest
+from PIL import Image
+
+from atlance.images import MAX_SIDE, downscale_image, read_exif
+
+
+def encoded(size: tuple, exif: bool = False) -> bytes:
+    """A plain JPEG of the given size, optionally with a DateTimeOriginal EXIF tag."""
+    image = Image.new("RGB", size, (30, 120, 200))
+    extra = {}
+    if exif:
+        tags = Image.Exif()
+        tags.get_ifd(0x8769)[0x9003] = "2024:10:20 18:45:00"
+        extra["exif"] = tags.tobytes()
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", **extra)
+    return buffer.getvalue()
+
+
+def test_large_image_is_shrunk_and_keeps_exif():
+    """The longest side is capped and the EXIF timestamp survives re-encoding."""
+    data, mime_type = downscale_image(encoded((4000, 3000), exif=True), "image/jpeg")
+    image = Image.open(io.BytesIO(data))
+    assert mime_type == "image/jpeg"
+    assert image.size == (MAX_SIDE, 768)
+    assert image.getexif().get_ifd(0x8769)[0x9003] == "2024:10:20 18:45:00"
+
+
+def test_small_image_is_passed_through():
+    """Images within the limit are sent as they are."""
+    original = encoded((640, 480))
+    assert downscale_image(original, "image/png") == (original, "image/png")
+
+
+def test_undecodable_image_is_passed_through():
+    """Formats Pillow cannot read, such as HEIC without a plugin, still reach the model."""
+    heic = b"\x00\x00\x00\x18ftypheic" + bytes(64)
+    assert downscale_image(heic, "image/heic") == (heic, "image/heic")
+
+
+def with_gps() -> bytes:
+    """A JPEG taken in Rotterdam on 20 Oct 2024 at 18:45 CEST."""
+    tags = Image.Exif()
+    tags.get_ifd(0x8769).update({0x9003: "2024:10:20 18:45:00", 0x9011: "+02:00"})
+    tags.get_ifd(0x8825).update({1: "N", 2: (51.0, 55.0, 12.0), 3: "E", 4: (4.0, 28.0, 48.0)})
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8)).save(buffer, format="JPEG", exif=tags.tobytes())
+    return buffer.getvalue()
+
+
+def test_exif_is_read_locally():
+    """Capture time becomes ISO 8601 with its offset, GPS becomes signed decimal degrees."""
+    metadata = read_exif(with_gps())
+    assert metadata["timestamp"] == "2024-10-20T18:45:00+02:00"
+    assert metadata["location"] == {"lat": pytest.approx(51.92), "lng": pytest.approx(4.48)}
+
+
+def test_missing_exif_is_null():
+    """Images without EXIF get null values instead of guesses."""
+    assert read_exif(encoded((8, 8))) == {"timestamp": None, "location": None}
+
+
+def test_unreadable_image_has_null_exif(monkeypatch):
+    """HEIC bytes and images above Pillow's pixel limit yield null metadata instead of failing the extractor."""
+    assert read_exif(b"\x00\x00\x00\x18ftypheic" + bytes(64)) == {"timestamp": None, "location": None}
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", 100)
+    assert read_exif(encoded((640, 480), exif=True)) == {"timestamp": None, "location": None}
@@ -0,0 +1,27 @@
+"""Tests for the genai client shared by all agents."""
+
+import asyncio
+
+from atlance import models
+from atlance.sub_agents.question_asker.agent import question_asker
+from atlance.sub_agents.story_agent.agent import story_agent
+
+
+def test_agents_share_one_client_per_event_loop(monkeypatch):
+    """Every model call in a loop goes through the same client; a new loop gets its own."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    monkeypatch.delenv("GOOGLE_GENAI_USE_VERTEXAI", raising=False)
+
+    async def clients():
+        return question_asker.canonical_model.api_client, story_agent.canonical_model.api_client
+
+    first, second = asyncio.run(clients()), asyncio.run(clients())
+    assert first[0] is first[1]
+    assert second[0] is not first[0]
+
+
+def test_shared_client_uses_http2(monkeypatch):
+    """The async transport negotiates HTTP/2 so concurrent agent calls multiplex over one connection."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    monkeypatch.delenv("GOOGLE_GENAI_USE_VERTEXAI", raising=False)
+    assert models._new_client()._api_client._async_httpx_client._transport._pool._http2
@@ -0,0 +1,36 @@
+"""Tests for the compiled perceptual hash."""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from atlance.phash import BLOCK, SIZE, hamming, image_phash, phash64
+
+
+def test_hash_matches_a_plain_dct():
+    """The compiled loops set the same bits as a matrix DCT-II of the low-frequency block."""
+    gray = np.random.default_rng(0).uniform(0, 255, (SIZE, SIZE)).astype(np.float32)
+    n = np.arange(SIZE)
+    basis = np.cos(np.pi * np.outer(np.arange(BLOCK), 2 * n + 1) / (2 * SIZE))
+    low = (basis @ gray.astype(np.float64) @ basis.T).flatten()
+    expected = int("".join("1" if c > np.median(low) else "0" for c in low), 2)
+    assert phash64(gray) == expected
+
+
+def test_large_jpeg_hashes_like_its_source():
+    """Decoding a big JPEG at reduced scale keeps it a near-duplicate of the lossless original."""
+    x, y = np.meshgrid(np.arange(1024), np.arange(1024))
+    photo = Image.fromarray((127 + 120 * np.sin(x / 37) * np.cos(y / 53)).astype(np.uint8)).convert("RGB")
+    original, copy = io.BytesIO(), io.BytesIO()
+    photo.save(original, format="PNG")
+    photo.save(copy, format="JPEG", quality=85)
+    assert hamming(image_phash(original.getvalue()), image_phash(copy.getvalue())) <= 2
+    assert hamming(image_phash(original.getvalue()), image_phash(original.getvalue())) == 0
+
+
+def test_undecodable_image_raises_oserror():
+    """Formats Pillow cannot read raise the documented error for the caller to handle."""
+    with pytest.raises(OSError):
+        image_phash(b"\x00\x00\x00\x18ftypheic" + bytes(64))
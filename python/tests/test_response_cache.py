@@ -0,0 +1,75 @@
+"""Tests for the on-disk model response cache shared by all agents."""
+
+from types import SimpleNamespace
+
+import pytest
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+from atlance import response_cache
+from atlance.sub_agents.question_asker.agent import QuestionResponse
+
+
+def request(instruction: str, text: str = "Here are my photos") -> LlmRequest:
+    """A request with a system instruction, a user message and a response schema."""
+    llm_request = LlmRequest(
+        model="gemini-2.5-flash",
+        contents=[types.Content(role="user", parts=[types.Part(text=text)])],
+        config=types.GenerateContentConfig(system_instruction=instruction),
+    )
+    llm_request.set_output_schema(QuestionResponse)
+    return llm_request
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep each test's cache in its own directory."""
+    monkeypatch.setattr(response_cache, "CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("ADK_NOCACHE", raising=False)
+
+
+def test_key_changes_with_instruction_and_contents():
+    """Editing an instruction or sending another message must miss the cache."""
+    key = response_cache.request_key(request("Ask one question."))
+    assert key == response_cache.request_key(request("Ask one question."))
+    assert key != response_cache.request_key(request("Ask two questions."))
+    assert key != response_cache.request_key(request("Ask one question.", text="Another album"))
+
+
+def test_response_is_written_through_and_reused(monkeypatch):
+    """A miss is stored after the model call and answers the identical next request."""
+    context = SimpleNamespace(state={}, agent_name="question_asker")
+    assert response_cache.cached_response(callback_context=context, llm_request=request("Ask")) is None
+    answer = LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text='{"question": "Where?"}')]),
+        finish_reason=types.FinishReason.STOP,
+    )
+    response_cache.store_response(callback_context=context, llm_response=answer)
+
+    context = SimpleNamespace(state={}, agent_name="question_asker")
+    assert response_cache.cached_response(callback_context=context, llm_request=request("Ask")) == answer
+
+    monkeypatch.setenv("ADK_NOCACHE", "1")
+    assert response_cache.cached_response(callback_context=context, llm_request=request("Ask")) is None
+
+
+def test_partial_responses_are_not_stored():
+    """Streamed chunks are never cached, only the complete response."""
+    context = SimpleNamespace(state={}, agent_name="question_asker")
+    response_cache.cached_response(callback_context=context, llm_request=request("Ask"))
+    chunk = LlmResponse(content=types.Content(role="model", parts=[types.Part(text='{"quest')]), partial=True)
+    response_cache.store_response(callback_context=context, llm_response=chunk)
+    assert response_cache.cached_response(callback_context=context, llm_request=request("Ask")) is None
+
+
+def test_truncated_responses_are_not_stored():
+    """A response cut off by the output token cap has content but must not be replayed."""
+    context = SimpleNamespace(state={}, agent_name="question_asker")
+    response_cache.cached_response(callback_context=context, llm_request=request("Ask"))
+    cut_off = LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text='{"question": "Where did you')]),
+        finish_reason=types.FinishReason.MAX_TOKENS,
+    )
+    response_cache.store_response(callback_context=context, llm_response=cut_off)
+    assert response_cache.cached_response(callback_context=context, llm_request=request("Ask")) is None
@@ -0,0 +1,48 @@
+"""Tests for the search budget and cache of the data extractor's search tool."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from atlance.sub_agents.data_extractor_agent import agent
+
+
+class FakeSearch:
+    """Stands in for the search agent tool and records the queries it receives."""
+
+    def __init__(self):
+        self.queries = []
+
+    async def run_async(self, *, args, tool_context):
+        self.queries.append(args["request"])
+        return f"about {args['request']}"
+
+
+@pytest.fixture
+def search(monkeypatch):
+    """Replace the search agent and start with an empty result cache."""
+    fake = FakeSearch()
+    monkeypatch.setattr(agent, "_search_tool", fake)
+    monkeypatch.setattr(agent, "_search_cache", agent.OrderedDict())
+    return fake
+
+
+def test_duplicates_and_repeats_are_searched_once(search):
+    """Identical queries within a call and across invocations reach the search agent once."""
+    context = SimpleNamespace(state={})
+    first = asyncio.run(agent.batch_google_search(["Erasmusbrug", "Erasmusbrug ", "Markthal"], context))
+    second = asyncio.run(agent.batch_google_search(["Markthal"], SimpleNamespace(state={})))
+    assert first == {"results": {"Erasmusbrug": "about Erasmusbrug", "Markthal": "about Markthal"}}
+    assert second == {"results": {"Markthal": "about Markthal"}}
+    assert search.queries == ["Erasmusbrug", "Markthal"]
+
+
+def test_budget_is_enforced_per_invocation(search):
+    """New searches beyond the budget are reported back instead of run."""
+    context = SimpleNamespace(state={})
+    asyncio.run(agent.batch_google_search([f"q{i}" for i in range(4)], context))
+    response = asyncio.run(agent.batch_google_search(["q4", "q5"], context))
+    assert list(response["results"]) == ["q4"]
+    assert "budget exhausted" in response["error"] and "q5" in response["error"]
+    assert len(search.queries) == agent.SEARCH_BUDGET
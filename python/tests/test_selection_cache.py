@@ -0,0 +1,68 @@
+"""Tests for the perceptual-hash cache of the duplicate remover."""
+
+import io
+import math
+from types import SimpleNamespace
+
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from PIL import Image
+
+from atlance.sub_agents.duplicate_remover_agent.agent import ImageSelectionResponse
+from atlance.sub_agents.duplicate_remover_agent.cache import CachedSelectionAgent, image_set_key
+
+
+def encoded(phase: float, fmt: str = "PNG", size: int = 128) -> bytes:
+    """A smooth wave pattern; unlike flat blocks its perceptual hash survives lossy re-encoding."""
+    image = Image.new("L", (size, size))
+    image.putdata(
+        [int(127 + 120 * math.sin(x / 9 + phase) * math.cos(y / 13)) for y in range(size) for x in range(size)]
+    )
+    buffer = io.BytesIO()
+    image.convert("RGB").save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def request_with(images: list) -> LlmRequest:
+    """A request that carries the images as inline parts."""
+    parts = [types.Part.from_bytes(data=data, mime_type="image/png") for data in images]
+    return LlmRequest(contents=[types.Content(role="user", parts=parts)])
+
+
+def test_key_ignores_encoding_but_not_order():
+    """Re-encoded copies share a key; a reordered album does not, since indices are positional."""
+    a, b = encoded(0.0), encoded(2.0)
+    assert image_set_key([a, b]) == image_set_key([encoded(0.0, fmt="JPEG"), b])
+    assert image_set_key([a, b]) != image_set_key([b, a])
+
+
+def test_selection_is_written_through_and_reused(tmp_path):
+    """A miss reaches the model; the stored selection answers the next identical request."""
+    agent = CachedSelectionAgent(
+        name="selector", model="gemini-2.5-flash", output_schema=ImageSelectionResponse, cache_dir=str(tmp_path)
+    )
+    before, after = agent.canonical_before_model_callbacks[0], agent.canonical_after_model_callbacks[-1]
+    context = SimpleNamespace(state={})
+    request = request_with([encoded(0.0), encoded(2.0)])
+
+    assert before(callback_context=context, llm_request=request) is None
+    answer = '{"selected_indices": [1]}'
+    after(
+        callback_context=context,
+        llm_response=LlmResponse(content=types.Content(role="model", parts=[types.Part(text=answer)])),
+    )
+
+    cached = before(callback_context=SimpleNamespace(state={}), llm_request=request)
+    assert ImageSelectionResponse.model_validate_json(cached.content.parts[0].text).selected_indices == [1]
+
+
+def test_undecodable_image_is_a_miss(tmp_path):
+    """An image the hash cannot read sends the request to the model instead of failing it."""
+    agent = CachedSelectionAgent(
+        name="selector", model="gemini-2.5-flash", output_schema=ImageSelectionResponse, cache_dir=str(tmp_path)
+    )
+    context = SimpleNamespace(state={})
+    request = request_with([encoded(0.0), b"\x00\x00\x00\x18ftypheic" + bytes(64)])
+    assert agent.canonical_before_model_callbacks[0](callback_context=context, llm_request=request) is None
+    assert context.state["temp:selection_cache_key"] is None
@@ -0,0 +1,46 @@
+"""Tests for decoding the streamed question of the question asker."""
+
+import asyncio
+import json
+
+from google.adk.events.event import Event
+from google.genai import types
+
+from atlance import server
+from atlance.server import partial_question
+from atlance.sub_agents.question_asker.agent import question_asker
+
+
+def test_question_grows_with_the_stream():
+    """Each chunk of JSON reveals more of the question, and the closing quote ends it."""
+    chunks = ['{"quest', 'ion": "Which ', "park is", ' this?"}']
+    seen = [partial_question("".join(chunks[: i + 1])) for i in range(len(chunks))]
+    assert seen == ["", "Which ", "Which park is", "Which park is this?"]
+
+
+def test_unfinished_escape_is_held_back():
+    """An escape split across chunks is only emitted once it is complete."""
+    assert partial_question('{"question": "Caf\\u00') == "Caf"
+    assert partial_question('{"question": "Caf\\u00e9?') == "Café?"
+    assert partial_question('{"question": "a\\\\u00') == "a\\u00"
+
+
+def test_truncated_question_ends_with_an_error_event(monkeypatch):
+    """A final answer cut off by the token cap closes the stream with an error, not an exception."""
+
+    async def run_async(**kwargs):
+        content = types.Content(role="model", parts=[types.Part(text='{"question": "Which park')])
+        yield Event(author=question_asker.name, content=content)
+
+    monkeypatch.setattr(server.runner, "run_async", run_async)
+    request = server.StreamRequest(user_id="user", session_id="s1", new_message=types.Content(role="user"))
+
+    async def collect():
+        return [event async for event in server.stream_turn(request)]
+
+    events = asyncio.run(collect())
+    assert events[-1].startswith("event: error\n")
+    assert json.loads(events[-1].split("data: ", 1)[1]) == {
+        "message": "incomplete question",
+        "partial_question": "Which park",
+    }
@@ -0,0 +1,90 @@
+"""Tests for racing agent copies with the speculative agent."""
+
+import asyncio
+import gc
+
+import pytest
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.events.event import Event
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from atlance.speculative_agent import SpeculativeAgent, speculate
+
+
+class SleepyAgent(BaseAgent):
+    """Answers with its own name after a delay, or fails when asked to."""
+
+    delay: float = 0.0
+    fail: bool = False
+
+    async def _run_async_impl(self, ctx):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(self.name)
+        yield Event(
+            invocation_id=ctx.invocation_id,
+            author=self.name,
+            content=types.Content(role="model", parts=[types.Part(text=self.name)]),
+        )
+
+
+def run(agent: BaseAgent) -> list[str]:
+    """Run the agent once and return the texts of its events."""
+
+    async def main():
+        runner = InMemoryRunner(agent=agent)
+        session = await runner.session_service.create_session(app_name=runner.app_name, user_id="user")
+        message = types.Content(role="user", parts=[types.Part(text="go")])
+        return [
+            event.content.parts[0].text
+            async for event in runner.run_async(user_id="user", session_id=session.id, new_message=message)
+        ]
+
+    return asyncio.run(main())
+
+
+def test_first_copy_to_finish_wins():
+    """Only the events of the fastest copy are emitted."""
+    agent = SpeculativeAgent(
+        name="race",
+        sub_agents=[SleepyAgent(name="slow", delay=0.5), SleepyAgent(name="fast", delay=0.01)],
+    )
+    assert run(agent) == ["fast"]
+
+
+def test_failed_copy_does_not_win():
+    """A copy that fails first is skipped in favour of one that succeeds."""
+    agent = SpeculativeAgent(
+        name="race",
+        sub_agents=[SleepyAgent(name="broken", fail=True), SleepyAgent(name="ok", delay=0.05)],
+    )
+    assert run(agent) == ["ok"]
+
+
+def test_speculate_with_one_copy_returns_agent():
+    """SPEC_N=1 disables speculation entirely."""
+    agent = SleepyAgent(name="single")
+    assert speculate(agent, n=1) is agent
+    assert [copy.name for copy in speculate(agent, n=2).sub_agents] == ["single_0", "single_1"]
+
+
+def test_agents_with_tools_cannot_be_raced():
+    """A tool-calling agent needs its own events between model calls, which buffering hides."""
+
+    def lookup(query: str) -> str:
+        """A stand-in tool."""
+        return query
+
+    agent = LlmAgent(name="searcher", model="gemini-2.5-flash", tools=[lookup])
+    with pytest.raises(ValueError, match="searcher"):
+        speculate(agent, n=2)
+
+
+def test_error_of_a_copy_finishing_with_the_winner_is_retrieved(caplog):
+    """A copy failing in the same round as the winner does not log "Task exception was never retrieved"."""
+    agent = SpeculativeAgent(name="race", sub_agents=[SleepyAgent(name="ok"), SleepyAgent(name="broken", fail=True)])
+    assert run(agent) == ["ok"]
+    gc.collect()
+    assert "never retrieved" not in caplog.text
@@ -0,0 +1,17 @@
+"""Tests that the structured agents get constrained JSON decoding from the model."""
+
+import pytest
+
+from atlance.sub_agents.duplicate_remover_agent.agent import duplicate_remover_template
+from atlance.sub_agents.question_asker.agent import question_asker
+
+
+@pytest.mark.parametrize("agent", [duplicate_remover_template, question_asker], ids=lambda agent: agent.name)
+def test_schema_agents_decode_json_without_tools(agent):
+    """
+    ADK only sends output_schema as response_schema when the agent has no tools; with tools it
+    falls back to a set_model_response function call, so adding a tool would silently drop it.
+    """
+    assert agent.output_schema is not None
+    assert not agent.tools
+    assert agent.generate_content_config.response_mime_type == "application/json"